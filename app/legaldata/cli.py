@@ -1,28 +1,42 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from collections.abc import Callable
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import typer
+from pydantic import TypeAdapter, ValidationError
+import xxhash
+from pybloom_live import ScalableBloomFilter
+try:  # libuv event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
-from legaldata.core.schemas import EvidenceSpan
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from legaldata.core.schemas import EvidenceColumn, EvidenceSpan, LegalReference
 
 from legaldata.core.config import settings
 from legaldata.core.http_client import PoliteAsyncHttpClient
 from legaldata.parsers.html_parser import parse_html
-from legaldata.extractors.registry import supported_variables, extract_by_names, extract_all
+from legaldata.extractors.registry import supported_variables, extract_by_names
+from legaldata.extractors.fused import extract_fused
 from legaldata.validators.quality_gates import validate_extracted_case
 from legaldata.core.schemas import ExtractedCase
 from legaldata.storage.session import SessionLocal, init_db
 from legaldata.storage.db import Document, Extraction, CrawlRun
 from legaldata.storage.raw_store import RawStore
+from legaldata.storage.bulk import copy_extractions, upsert_documents
+from legaldata.storage.extract_cache import ExtractCache
 from legaldata.sources.elitigation.listing import build_listing_url, parse_listing_html
 
 
@@ -31,6 +45,20 @@ console = Console()
 
 USER_AGENT = "SMU-CDL-AssessmentScraper/1.0 (contact: youremail@example.com) respectful-crawl"
 
+# Validate/serialize whole collections in one pydantic-core call
+_EV_LIST_ADAPTER = TypeAdapter(list[EvidenceSpan])
+_EV_MAP_ADAPTER = TypeAdapter(dict[str, EvidenceColumn])
+_LR_LIST_ADAPTER = TypeAdapter(list[LegalReference])
+
+# Variable name -> Extraction column, resolved once instead of per DB row
+_SUPPORTED_SET = frozenset(supported_variables())
+_FIELD_GETTERS: dict[str, Callable[[Extraction], Any]] = {
+    name: attrgetter(name) for name in supported_variables()
+}
+
+# Part of the extraction cache key, so bumping the version invalidates cached results
+_EXTRACTOR_VERSION: str = ExtractedCase.model_fields["extractor_version"].default
+
 
 def _format_value(var: str, val: object) -> str:
     if val is None:
@@ -85,14 +113,26 @@ def _format_value(var: str, val: object) -> str:
     # Default
     return str(val)
 
-def _normalize_db_evidence(ev: object) -> list[EvidenceSpan]:
+def _normalize_db_evidence(ev: object) -> EvidenceColumn:
     """
-    Convert DB-stored evidence (list[dict]) back into EvidenceSpan objects
-    so _format_evidence can be reused unchanged.
+    Convert DB-stored evidence back into an EvidenceColumn.
+
+    Current rows store {kinds, locations, snippets}; older rows stored a
+    list of EvidenceSpan dicts.
     """
+    if isinstance(ev, dict):
+        # Written by _process_one from a validated model: trust it
+        return EvidenceColumn.model_construct(**ev)
+
     if not ev or not isinstance(ev, list):
-        return []
+        return EvidenceColumn()
+
+    try:
+        return EvidenceColumn.from_spans(_EV_LIST_ADAPTER.validate_python(ev))
+    except ValidationError:
+        pass
 
+    # Slow path: keep whichever items are valid
     spans: list[EvidenceSpan] = []
     for item in ev:
         if isinstance(item, EvidenceSpan):
@@ -102,40 +142,45 @@ def _normalize_db_evidence(ev: object) -> list[EvidenceSpan]:
                 spans.append(EvidenceSpan(**item))
             except Exception:
                 continue
-    return spans
+    return EvidenceColumn.from_spans(spans)
 
 def _format_evidence(ev: object, max_items: int = 2) -> str:
     """
-    Render EvidenceSpan list into a short, human-friendly snippet.
-    Expected: list[EvidenceSpan] with fields like kind/location/snippet.
+    Render evidence into a short, human-friendly snippet.
+    Expected: EvidenceColumn, or a list[EvidenceSpan] straight from an extractor.
     Defensive: return empty string if shape differs.
     """
     if not ev:
         return ""
 
-    if not isinstance(ev, list):
+    if isinstance(ev, list):
+        ev = EvidenceColumn.from_spans([e for e in ev if isinstance(e, EvidenceSpan)])
+
+    if not isinstance(ev, EvidenceColumn):
         return ""
 
     chunks: list[str] = []
-    for item in ev[:max_items]:
-        try:
-            loc = getattr(item, "location", "") or ""
-            snippet = getattr(item, "snippet", "") or ""
-            snippet = " ".join(str(snippet).split())
-            if loc and snippet:
-                chunks.append(f"{loc}: {snippet[:140]}")
-            elif snippet:
-                chunks.append(snippet[:140])
-        except Exception:
-            continue
+    for loc, snippet in zip(ev.locations[:max_items], ev.snippets[:max_items]):
+        snippet = " ".join(str(snippet).split())
+        if loc and snippet:
+            chunks.append(f"{loc}: {snippet[:140]}")
+        elif snippet:
+            chunks.append(snippet[:140])
 
     return "\n".join(chunks)
 
 
+def _run(coro: Any) -> Any:
+    """Run a command's coroutine on uvloop when installed, else the default asyncio loop."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 @app.command()
 def initdb() -> None:
     """Create DB tables (assessment-friendly)."""
-    asyncio.run(init_db())
+    _run(init_db())
     console.print("[green]DB initialised.[/green]")
 
 
@@ -143,13 +188,38 @@ def initdb() -> None:
 def crawl(
     max_pages: Optional[int] = typer.Option(3, help="Safety cap for demo. Use --max-pages 0 for unlimited."),
     max_cases: Optional[int] = typer.Option(50, help="Safety cap for demo. Use --max-cases 0 for unlimited."),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Re-fetch already extracted judgments; pages whose HTML is unchanged are not re-extracted.",
+    ),
 ) -> None:
     """Crawl judgments listing and extract variables into the DB."""
-    asyncio.run(_crawl_async(max_pages if max_pages and max_pages > 0 else None,
-                             max_cases if max_cases and max_cases > 0 else None))
+    _run(_crawl_async(max_pages if max_pages and max_pages > 0 else None,
+                      max_cases if max_cases and max_cases > 0 else None,
+                      refresh))
+
+
+@dataclass
+class ProcessedCase:
+    """Outcome of one judgment, staged in memory until its listing page is flushed."""
+    document: dict[str, Any]
+    extraction: Optional[dict[str, Any]] = None
+
+
+def _normalize_url(url: str) -> str:
+    # Optional: normalize gdviewer -> gd for easier extraction
+    if "/gdviewer/s/" in url:
+        url = url.replace("/gdviewer/s/", "/gd/s/")
 
+    # Canonical form so the same judgment is only seen once: lowercase
+    # scheme/host, drop the fragment, sort query parameters.
+    u = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(u.query, keep_blank_values=True)))
+    return urlunsplit((u.scheme.lower(), u.netloc.lower(), u.path, query, ""))
 
-async def _crawl_async(max_pages: Optional[int], max_cases: Optional[int]) -> None:
+
+async def _crawl_async(max_pages: Optional[int], max_cases: Optional[int], refresh: bool = False) -> None:
     await init_db()
     raw_store = RawStore(settings.raw_store_dir)
     raw_store.ensure()
@@ -161,18 +231,27 @@ async def _crawl_async(max_pages: Optional[int], max_cases: Optional[int]) -> No
         min_delay_s=settings.min_delay_s,
         max_retries=settings.max_retries,
     )
+    cache = ExtractCache(settings.extract_cache_dir) if settings.extract_cache_dir else None
 
     async with SessionLocal() as session:
-        run = CrawlRun(status="RUNNING", params={"max_pages": max_pages, "max_cases": max_cases})
+        run = CrawlRun(
+            status="RUNNING",
+            params={"max_pages": max_pages, "max_cases": max_cases, "refresh": refresh},
+        )
         session.add(run)
         await session.commit()
-        await session.refresh(run)
 
         stats = {"pages_crawled": 0, "cases_seen": 0, "cases_processed": 0, "cases_failed": 0}
 
         try:
             page = 1
-            seen_urls: set[str] = set()
+            # Probabilistic de-dup: ~a few bytes per URL instead of a full str in a set.
+            # A false positive only skips a URL for this run; the DB stays authoritative.
+            seen_urls = ScalableBloomFilter(
+                initial_capacity=settings.seen_urls_capacity,
+                error_rate=settings.seen_urls_error_rate,
+                mode=ScalableBloomFilter.SMALL_SET_GROWTH,
+            )
 
             with Progress(
                 SpinnerColumn(),
@@ -186,45 +265,101 @@ async def _crawl_async(max_pages: Optional[int], max_cases: Optional[int]) -> No
                 t_pages = progress.add_task("Listing pages", total=max_pages or 10_000_000)
                 t_cases = progress.add_task("Cases processed", total=max_cases or 10_000_000)
 
-                while True:
-                    if max_pages is not None and stats["pages_crawled"] >= max_pages:
-                        break
-
-                    listing_url = build_listing_url(settings.source_listing_url, page)
-                    listing_res = await client.get_text(listing_url)
-                    listing = parse_listing_html(settings.source_base_url, listing_res.text, page_num=page)
-                    console.print(f"[dim]Page {page}: found {len(listing.judgment_urls)} judgment links[/dim]")
-                    stats["pages_crawled"] += 1
-                    progress.advance(t_pages, 1)
-
-                    if not listing.judgment_urls:
-                        break
-
-                    new_urls = [u for u in listing.judgment_urls if u not in seen_urls]
-                    for u in new_urls:
-                        seen_urls.add(u)
-
-                    stats["cases_seen"] = len(seen_urls)
-
-                    if max_cases is not None and stats["cases_seen"] >= max_cases:
-                        new_urls = new_urls[: max(0, max_cases - (stats["cases_seen"] - len(new_urls)))]
-
-                    async def process(url: str) -> None:
-                        nonlocal stats
+                # URLs stream through a bounded queue to a fixed set of workers, so the
+                # next listing page is fetched while this one's cases are in flight.
+                # Workers never touch the DB; finished cases are flushed from here.
+                queue: asyncio.Queue[tuple[str, Optional[str]]] = asyncio.Queue(
+                    maxsize=settings.max_concurrency * 2
+                )
+                done: list[ProcessedCase] = []
+
+                async def worker() -> None:
+                    while True:
+                        url, known_hash = await queue.get()
                         try:
-                            async with SessionLocal() as task_session:
-                                await _process_one(task_session, client, raw_store, url)
-                            stats["cases_processed"] += 1
-                        except Exception:
-                            stats["cases_failed"] += 1
+                            result = await _process_one(client, raw_store, url, known_hash, cache)
+                            if result is not None and result.document["status"] == "FAILED":
+                                stats["cases_failed"] += 1
+                            else:
+                                stats["cases_processed"] += 1
+                            if result is not None:
+                                done.append(result)
                         finally:
                             progress.advance(t_cases, 1)
-
-                    await asyncio.gather(*(process(u) for u in new_urls))
-
-                    if max_cases is not None and stats["cases_seen"] >= max_cases:
-                        break
-                    page += 1
+                            queue.task_done()
+
+                async def flush_done() -> None:
+                    batch = done.copy()
+                    await _flush_results(session, batch)
+                    # Only once committed; workers only append, so later results stay queued
+                    del done[: len(batch)]
+
+                async def stop_workers() -> None:
+                    for w in workers:
+                        w.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+
+                workers = [asyncio.create_task(worker()) for _ in range(settings.max_concurrency)]
+                try:
+                    while True:
+                        if max_pages is not None and stats["pages_crawled"] >= max_pages:
+                            break
+
+                        listing_url = build_listing_url(settings.source_listing_url, page)
+                        listing_res = await client.get_text(listing_url)
+                        listing = parse_listing_html(settings.source_base_url, listing_res.text, page_num=page)
+                        console.print(f"[dim]Page {page}: found {len(listing.judgment_urls)} judgment links[/dim]")
+                        stats["pages_crawled"] += 1
+                        progress.advance(t_pages, 1)
+
+                        if not listing.judgment_urls:
+                            break
+
+                        new_urls: list[str] = []
+                        for u in map(_normalize_url, listing.judgment_urls):
+                            if u not in seen_urls:
+                                seen_urls.add(u)
+                                new_urls.append(u)
+
+                        stats["cases_seen"] = len(seen_urls)
+
+                        if max_cases is not None and stats["cases_seen"] >= max_cases:
+                            new_urls = new_urls[: max(0, max_cases - (stats["cases_seen"] - len(new_urls)))]
+
+                        # Already-extracted documents are skipped (idempotent re-runs),
+                        # unless refreshing, where only their content hash is needed.
+                        extracted = await _extracted_hashes(session, new_urls, with_hash=refresh)
+                        if not refresh:
+                            stats["cases_processed"] += len(extracted)
+                            progress.advance(t_cases, len(extracted))
+                            new_urls = [u for u in new_urls if u not in extracted]
+                            extracted = {}
+
+                        for u in new_urls:
+                            await queue.put((u, extracted.get(u)))
+
+                        # Write whatever has finished so far, one transaction per page
+                        await flush_done()
+
+                        if max_cases is not None and stats["cases_seen"] >= max_cases:
+                            break
+                        page += 1
+
+                    await queue.join()
+                    await flush_done()
+                except Exception as e:
+                    await stop_workers()
+                    # If listing failed, cases that already finished are still written before
+                    # the run is marked FAILED. Not after a DB error: that page was rolled back
+                    # and the connection may be unusable. Either way the original error is raised.
+                    if done and not isinstance(e, SQLAlchemyError):
+                        try:
+                            await flush_done()
+                        except Exception as flush_error:
+                            console.print(f"[red]Could not write finished cases: {flush_error}[/red]")
+                    raise
+                finally:
+                    await stop_workers()
 
             run.status = "DONE"
             run.stats = stats
@@ -234,6 +369,8 @@ async def _crawl_async(max_pages: Optional[int], max_cases: Optional[int]) -> No
             console.print("[green]Crawl complete[/green]", stats)
 
         except Exception as e:
+            # Page writes share this session; never let recording the failure commit a partial one
+            await session.rollback()
             run.status = "FAILED"
             run.error = f"{type(e).__name__}: {e}"
             run.finished_at = datetime.utcnow()
@@ -241,14 +378,81 @@ async def _crawl_async(max_pages: Optional[int], max_cases: Optional[int]) -> No
             raise
         finally:
             await client.close()
+            if cache is not None:
+                cache.close()
+
+
+async def _extracted_hashes(
+    session: AsyncSession, urls: list[str], with_hash: bool = True
+) -> dict[str, Optional[str]]:
+    """
+    Return {url: content_hash} for the given URLs that are already EXTRACTED.
+
+    With `with_hash=False` only URLs are read (hashes come back as None), which
+    the (url, status) index answers on its own.
+    """
+    if not urls:
+        return {}
+    cols = (Document.url, Document.content_hash) if with_hash else (Document.url,)
+    rows = await session.execute(
+        select(*cols).where(Document.url.in_(urls), Document.status == "EXTRACTED")
+    )
+    return {row[0]: (row[1] if with_hash else None) for row in rows.all()}
+
+
+async def _flush_results(session: AsyncSession, results: list[ProcessedCase]) -> None:
+    """
+    Write a batch of finished results in a single transaction on the crawl's session.
+
+    Documents and extractions go out as two executemany upserts. If the batch
+    hits an IntegrityError, fall back to writing row by row so one bad record
+    doesn't drop the whole page. Any other error rolls the page back and is
+    re-raised, so a half-written page is never committed later.
+    """
+    if not results:
+        return
+
+    try:
+        await _write_results(session, results)
+        await session.commit()
+        return
+    except IntegrityError:
+        await session.rollback()
+    except Exception:
+        await session.rollback()
+        raise
+
+    for result in results:
+        try:
+            await _write_results(session, [result])
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            console.print(f"[red]DB write failed for {result.document['url']}: {e.orig}[/red]")
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def _write_results(session: AsyncSession, results: list[ProcessedCase]) -> None:
+    doc_ids = await upsert_documents(session, [r.document for r in results])
+    await copy_extractions(
+        session,
+        [
+            {"document_id": doc_ids[r.document["url"]], **r.extraction}
+            for r in results
+            if r.extraction is not None
+        ],
+    )
 
 
 async def _process_one(
-    session: AsyncSession,
     client: PoliteAsyncHttpClient,
     raw_store: RawStore,
     url: str,
-) -> None:
+    known_hash: Optional[str] = None,
+    cache: Optional[ExtractCache] = None,
+) -> Optional[ProcessedCase]:
     """
     Process a single judgment URL.
 
@@ -257,104 +461,101 @@ async def _process_one(
     - Always store an Extraction row (even if some fields are missing).
     - Treat validator outputs as WARNINGS, not hard failures.
     - Mark FAILED only for true runtime exceptions.
-    """
-    try:
-        # Optional: normalize gdviewer -> gd for easier extraction
-        if "/gdviewer/s/" in url:
-            url = url.replace("/gdviewer/s/", "/gd/s/")
-
-        existing = await session.scalar(select(Document).where(Document.url == url))
-        if existing and existing.status == "EXTRACTED":
-            return
 
-        if not existing:
-            existing = Document(url=url, source="elitigation", status="RECEIVED")
-            session.add(existing)
-            try:
-                await session.commit()
-            except IntegrityError:
-                # URL already inserted by another worker / previous run
-                await session.rollback()
-                existing = await session.scalar(select(Document).where(Document.url == url))
+    Nothing is written to the DB here; the caller flushes a page of results at once.
+    Returns None when the page hashes to `known_hash` (already extracted, unchanged).
+    With a `cache`, extraction results are memoized on the page hash.
+    """
+    document: dict[str, Any] = {
+        "url": url,
+        "source": "elitigation",
+        "raw_path": None,
+        "status": "RECEIVED",
+        "error": None,
+        "content_hash": None,
+    }
 
+    try:
         # Fetch + persist raw artifact
-        res = await client.get_text(url)
-        raw_path = raw_store.write_html(url, res.text)
-
-        existing.raw_path = str(raw_path)
-        existing.status = "FETCHED"
-        existing.fetched_at = datetime.utcnow()
-        existing.error = None
-        await session.commit()
-
-        # Parse + extract
-        parsed = parse_html(url, res.text)
-        extracted = extract_all(parsed)
-
-        record = ExtractedCase(url=url)
-
-        # Unpack extraction outputs
-        for k, payload  in extracted.items():
-            if isinstance(payload, tuple) and len(payload) == 2:
-                v, ev = payload
-            else:
-                v, ev = payload, []
-
-            if k == "case_citation":
-                record.case_citation = v
-            elif k == "decision_date":
-                record.decision_date = v
-            elif k == "presiding_judges":
-                record.presiding_judges = v or []
-            elif k == "parties":
-                record.parties = v
-            elif k == "legal_references_cited":
-                record.legal_references_cited = v or []
-
-            record.evidence[k] = ev or []
-
-        # Validation => WARNINGS only (do not fail the document)
-        ok, errors = validate_extracted_case(record)
-
-        # Always write Extraction (partial allowed)
-        ex = await session.scalar(select(Extraction).where(Extraction.document_id == existing.id))
-        if ex is None:
-            ex = Extraction(document_id=existing.id)
-            session.add(ex)
-
-        ex.case_citation = record.case_citation
-        ex.decision_date = record.decision_date.isoformat() if record.decision_date else None
-        ex.presiding_judges = record.presiding_judges
-        ex.parties = record.parties.model_dump() if record.parties else None
-        ex.legal_references_cited = (
-            [r.model_dump() for r in record.legal_references_cited]
-            if record.legal_references_cited
-            else []
-        )
-        ex.evidence = {k: [e.model_dump() for e in v] for k, v in record.evidence.items()}
-        ex.extractor_version = record.extractor_version
+        # Raw bytes are hashed, stored and parsed as-is (no str round-trip)
+        res = await client.get_bytes(url)
+        content_hash = xxhash.xxh3_64_hexdigest(res.content)
+        if content_hash == known_hash:
+            return None
+        # Compress + write off the event loop
+        raw_path = await asyncio.to_thread(raw_store.write_html, url, res.content)
+
+        document["content_hash"] = content_hash
+        document["raw_path"] = str(raw_path)
+        document["status"] = "FETCHED"
+
+        # Parse + extract, unless an identical page was already extracted by this version
+        cache_key = ExtractCache.key(_EXTRACTOR_VERSION, url, content_hash)
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached is not None:
+            extraction, warnings = cached["extraction"], cached["warnings"]
+        else:
+            extraction, warnings = _extract_record(url, res.content, res.encoding)
+            if cache is not None:
+                cache.set(cache_key, {"extraction": extraction, "warnings": warnings})
 
         # Mark as EXTRACTED regardless; store warnings in `error` for visibility
-        existing.status = "EXTRACTED"
+        document["status"] = "EXTRACTED"
+        document["error"] = warnings
 
-        # If validator says not ok, record warnings instead of failing
-        existing.error = "; ".join(errors)[:4000] if (not ok and errors) else None
-
-        await session.commit()
+        return ProcessedCase(document=document, extraction=extraction)
 
     except Exception as e:
         # True failure case (network error, parse crash, etc.)
-        await session.rollback()
+        document["status"] = "FAILED"
+        document["error"] = f"{type(e).__name__}: {e}"[:4000]
+        return ProcessedCase(document=document)
 
-        # Try to persist failure reason if we have a Document row
-        existing = await session.scalar(select(Document).where(Document.url == url))
-        if existing:
-            existing.status = "FAILED"
-            existing.error = f"{type(e).__name__}: {e}"[:4000]
-            await session.commit()
 
-        # Re-raise to let caller count failures / log
-        raise
+def _extract_record(url: str, content: bytes, encoding: Optional[str]) -> tuple[dict[str, Any], Optional[str]]:
+    """Parse, extract and validate one page. Returns (Extraction row values, validator warnings)."""
+    parsed = parse_html(url, content, encoding=encoding)
+    extracted = extract_fused(parsed)
+
+    record = ExtractedCase(url=url)
+
+    # Unpack extraction outputs
+    for k, payload  in extracted.items():
+        if isinstance(payload, tuple) and len(payload) == 2:
+            v, ev = payload
+        else:
+            v, ev = payload, []
+
+        if k == "case_citation":
+            record.case_citation = v
+        elif k == "decision_date":
+            record.decision_date = v
+        elif k == "presiding_judges":
+            record.presiding_judges = v or []
+        elif k == "parties":
+            record.parties = v
+        elif k == "legal_references_cited":
+            record.legal_references_cited = v or []
+
+        record.evidence[k] = EvidenceColumn.from_spans(ev or [])
+
+    # Validation => WARNINGS only (do not fail the document)
+    ok, errors = validate_extracted_case(record)
+
+    # Always write Extraction (partial allowed)
+    extraction = {
+        "case_citation": record.case_citation,
+        "decision_date": record.decision_date.isoformat() if record.decision_date else None,
+        "presiding_judges": record.presiding_judges,
+        "parties": record.parties.model_dump() if record.parties else None,
+        "legal_references_cited": _LR_LIST_ADAPTER.dump_python(record.legal_references_cited),
+        "evidence": _EV_MAP_ADAPTER.dump_python(record.evidence),
+        "extractor_version": record.extractor_version,
+    }
+
+    # If validator says not ok, record warnings instead of failing
+    warnings = "; ".join(errors)[:4000] if (not ok and errors) else None
+    return extraction, warnings
 
 
 @app.command()
@@ -373,7 +574,7 @@ def extract(
     ),
 ) -> None:
     """Extract one or more variables from a single judgment URL (does not require crawl)."""
-    asyncio.run(_extract_one_async(url, variable, with_evidence))
+    _run(_extract_one_async(url, variable, with_evidence))
 
 
 
@@ -397,7 +598,7 @@ async def _extract_one_async(url: str, variables: Optional[list[str]], with_evid
         if variables:
             out = extract_by_names(parsed, variables)
         else:
-            out = extract_all(parsed)
+            out = extract_fused(parsed)
 
         table = Table(title="Extraction result", show_lines=True)
         table.add_column("Variable", style="bold")
@@ -438,12 +639,12 @@ def search(
         help="Show evidence snippets if available",
     ),
 ) -> None:
-    asyncio.run(_search_async(variable, limit, with_evidence))
+    _run(_search_async(variable, limit, with_evidence))
 
 
 
 async def _search_async(variable: str, limit: int, with_evidence: bool) -> None:
-    if variable not in supported_variables():
+    if variable not in _SUPPORTED_SET:
         raise typer.BadParameter(
             f"Unknown variable '{variable}'. Supported: {', '.join(supported_variables())}"
         )
@@ -476,30 +677,16 @@ async def _search_async(variable: str, limit: int, with_evidence: bool) -> None:
         ) as progress:
             t = progress.add_task("query", total=max(len(rows), 1))
 
+            get_value = _FIELD_GETTERS[variable]
             for d, e in rows:
-                # Map variable -> field
-                if variable == "case_citation":
-                    val = e.case_citation
-                elif variable == "decision_date":
-                    val = e.decision_date
-                elif variable == "presiding_judges":
-                    val = e.presiding_judges
-                elif variable == "parties":
-                    val = e.parties
-                elif variable == "legal_references_cited":
-                    val = e.legal_references_cited
-                else:
-                    # Should never happen due to supported_variables() check
-                    val = None
-
+                val = get_value(e)
                 val_txt = _format_value(variable, val)
 
                 if with_evidence:
-                    # evidence is stored as dict: {var: [EvidenceSpanDump, ...], ...}
+                    # evidence is stored as dict: {var: {kinds, locations, snippets}, ...}
                     ev_dict = e.evidence or {}
                     raw_ev = ev_dict.get(variable, [])
-                    ev_spans = _normalize_db_evidence(raw_ev)
-                    ev_txt = _format_evidence(ev_spans)
+                    ev_txt = _format_evidence(_normalize_db_evidence(raw_ev))
                     table.add_row(str(e.extracted_at), d.url, val_txt, ev_txt)
                 else:
                     table.add_row(str(e.extracted_at), d.url, val_txt)
@@ -512,24 +699,26 @@ async def _search_async(variable: str, limit: int, with_evidence: bool) -> None:
 @app.command()
 def stats() -> None:
     """Show simple pipeline health stats (counts by status + top error reasons)."""
-    asyncio.run(_stats_async())
+    _run(_stats_async())
 
 
 async def _stats_async() -> None:
     await init_db()
     async with SessionLocal() as session:
-        docs = (await session.execute(select(Document.status, Document.error))).all()
-
-        status_counts: dict[str, int] = {}
-        for status, _err in docs:
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts: dict[str, int] = dict(
+            (await session.execute(select(Document.status, func.count()).group_by(Document.status))).all()
+        )
 
-        err_counts: dict[str, int] = {}
-        for _status, err in docs:
-            if not err:
-                continue
-            key = str(err)[:120]
-            err_counts[key] = err_counts.get(key, 0) + 1
+        err_key = func.substr(Document.error, 1, 120)
+        err_counts: list[tuple[str, int]] = (
+            await session.execute(
+                select(err_key, func.count())
+                .where(Document.error.is_not(None), Document.error != "")
+                .group_by(err_key)
+                .order_by(func.count().desc())
+                .limit(10)
+            )
+        ).all()
 
         table = Table(title="Pipeline stats", show_lines=True)
         table.add_column("Metric")
@@ -545,7 +734,7 @@ async def _stats_async() -> None:
             err_table = Table(title="Top error reasons (truncated)", show_lines=True)
             err_table.add_column("Count", justify="right")
             err_table.add_column("Error")
-            for err, cnt in sorted(err_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
+            for err, cnt in err_counts:
                 err_table.add_row(str(cnt), err)
             console.print(err_table)
         else:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,6 +14,8 @@ class Settings(BaseSettings):
     # Storage
     database_url: str = "sqlite+aiosqlite:///./data/legaldata.db"
     raw_store_dir: Path = Path("data/raw")
+    # Opt-in on-disk memo of extraction results keyed by page hash (unset = off)
+    extract_cache_dir: Optional[Path] = None
 
     # Crawl politeness
     max_concurrency: int = 5
@@ -19,6 +23,10 @@ class Settings(BaseSettings):
     max_retries: int = 5
     timeout_s: float = 30.0
 
+    # In-run URL de-dup (scalable Bloom filter; grows past the initial capacity)
+    seen_urls_capacity: int = 100_000
+    seen_urls_error_rate: float = 1e-6
+
     # Source defaults
     source_base_url: str = "https://www.elitigation.sg"
     # Paginated listing endpoint for Supreme Court judgments
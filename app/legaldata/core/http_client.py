@@ -3,9 +3,22 @@ from __future__ import annotations
 import asyncio
 import random
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
 import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    RetryError,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+# Upper bound on how long we honour a server's Retry-After before retrying anyway
+MAX_RETRY_AFTER_S = 60.0
 
 
 @dataclass(frozen=True)
@@ -15,13 +28,61 @@ class FetchResult:
     text: str
 
 
+@dataclass(frozen=True)
+class FetchBytesResult:
+    url: str
+    status_code: int
+    content: bytes
+    encoding: Optional[str]
+
+
+class RetryableStatusError(Exception):
+    """A 429/5xx response; carries the server's Retry-After hint (seconds) if any."""
+
+    def __init__(self, resp: httpx.Response) -> None:
+        super().__init__(f"HTTP {resp.status_code} for {resp.url}")
+        self.status_code = resp.status_code
+        self.retry_after = _parse_retry_after(resp.headers.get("retry-after"))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Full jitter: a random wait in a window that starts at 0.2s and doubles per attempt, up to 10s
+_backoff = wait_random_exponential(multiplier=0.2, max=10)
+
+
+def _wait_before_retry(state: RetryCallState) -> float:
+    """Honour Retry-After (capped) when the server sent one, else jittered exponential backoff."""
+    exc = state.outcome.exception() if state.outcome else None
+    if isinstance(exc, RetryableStatusError) and exc.retry_after is not None:
+        return min(exc.retry_after, MAX_RETRY_AFTER_S)
+    return _backoff(state)
+
+
 class PoliteAsyncHttpClient:
     """Async HTTP client with polite crawling defaults.
 
     Features:
     - bounded concurrency
     - jittered per-request delay
-    - exponential backoff retries for 429/5xx
+    - jittered exponential backoff retries for transport errors and 429/5xx,
+      honouring Retry-After
+    - HTTP/2 over a bounded keep-alive connection pool
     """
 
     def __init__(
@@ -37,6 +98,14 @@ class PoliteAsyncHttpClient:
             headers={"User-Agent": user_agent},
             timeout=httpx.Timeout(timeout_s),
             follow_redirects=True,
+            # HTTP/2 multiplexes concurrent judgment fetches over few keep-alive connections
+            # (set on the client, not a custom transport, so HTTPS_PROXY etc. still apply)
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_concurrency * 2,
+                max_connections=max_concurrency * 4,
+                keepalive_expiry=30,
+            ),
         )
         self._sem = asyncio.Semaphore(max_concurrency)
         self._min_delay_s = min_delay_s
@@ -46,22 +115,34 @@ class PoliteAsyncHttpClient:
         await self._client.aclose()
 
     async def get_text(self, url: str) -> FetchResult:
+        resp = await self._get(url)
+        return FetchResult(url=url, status_code=resp.status_code, text=resp.text)
+
+    async def get_bytes(self, url: str) -> FetchBytesResult:
+        """Like get_text, but skips decoding for consumers that take raw bytes."""
+        resp = await self._get(url)
+        return FetchBytesResult(
+            url=url, status_code=resp.status_code, content=resp.content, encoding=resp.encoding
+        )
+
+    async def _get(self, url: str) -> httpx.Response:
         async with self._sem:
-            await asyncio.sleep(self._min_delay_s + random.random() * self._min_delay_s)
-
-            last_exc: Optional[Exception] = None
-            for attempt in range(self._max_retries):
-                try:
-                    resp = await self._client.get(url)
-                    if resp.status_code in (429, 502, 503, 504):
-                        backoff = min(10.0, (2 ** attempt) + random.random())
-                        await asyncio.sleep(backoff)
-                        continue
-                    resp.raise_for_status()
-                    return FetchResult(url=url, status_code=resp.status_code, text=resp.text)
-                except Exception as e:
-                    last_exc = e
-                    backoff = min(10.0, (2 ** attempt) + random.random())
-                    await asyncio.sleep(backoff)
-
-            raise RuntimeError(f"Failed to fetch after retries: {url}") from last_exc
+            await asyncio.sleep(self._min_delay_s + random.uniform(0, self._min_delay_s))
+
+            # Only transport errors and 429/5xx are retried; anything else surfaces at once.
+            retrying = AsyncRetrying(
+                retry=retry_if_exception_type((httpx.TransportError, RetryableStatusError)),
+                wait=_wait_before_retry,
+                stop=stop_after_attempt(self._max_retries),
+            )
+            try:
+                return await retrying(self._get_once, url)
+            except RetryError as e:
+                raise RuntimeError(f"Failed to fetch after retries: {url}") from e.last_attempt.exception()
+
+    async def _get_once(self, url: str) -> httpx.Response:
+        resp = await self._client.get(url)
+        if resp.status_code == 429 or resp.status_code >= 500:
+            raise RetryableStatusError(resp)
+        resp.raise_for_status()
+        return resp
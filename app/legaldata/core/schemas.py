@@ -13,6 +13,22 @@ class EvidenceSpan(BaseModel):
     snippet: str = Field(..., description="Small snippet showing the match.")
 
 
+class EvidenceColumn(BaseModel):
+    """Evidence spans for one variable, stored column-wise (one list per EvidenceSpan field)."""
+    kinds: list[Literal["line", "regex", "dom"]] = Field(default_factory=list)
+    locations: list[str] = Field(default_factory=list)
+    snippets: list[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_spans(cls, spans: list[EvidenceSpan]) -> EvidenceColumn:
+        # Spans are already validated models; skip re-validating their fields
+        return cls.model_construct(
+            kinds=[s.kind for s in spans],
+            locations=[s.location for s in spans],
+            snippets=[s.snippet for s in spans],
+        )
+
+
 class LegalReference(BaseModel):
     """One cited authority (best-effort normalization)."""
     ref_type: Literal["case", "statute", "other"] = "case"
@@ -39,7 +55,7 @@ class ExtractedCase(BaseModel):
     parties: Parties = Field(default_factory=Parties)
 
     # Provenance
-    evidence: dict[str, list[EvidenceSpan]] = Field(default_factory=dict)
+    evidence: dict[str, EvidenceColumn] = Field(default_factory=dict)
 
     extracted_at: datetime = Field(default_factory=datetime.utcnow)
     extractor_version: str = "v1"
@@ -4,29 +4,32 @@ import re
 from typing import Optional
 
 from legaldata.core.schemas import EvidenceSpan
-from legaldata.parsers.html_parser import ParsedDocument
+from legaldata.parsers.html_parser import ParsedDocument, select_lines
 
 
 # Best-effort: match "[YYYY] SGXXXX N" (don’t anchor end-of-string)
 CITATION_RE = re.compile(r"\[(\d{4})\]\s+SG[A-Z]{2,}\s+\d+", re.IGNORECASE)
 URL_SLUG_RE = re.compile(r"/gd/s/(?P<slug>\d{4}_[A-Z]+_\d+)$", re.IGNORECASE)
-
-def extract_case_citation(doc: ParsedDocument) -> tuple[Optional[str], list[EvidenceSpan]]:
-    evidence: list[EvidenceSpan] = []
-
-    # Try text first
-    for i, ln in enumerate((doc.lines or [])[:400]):
-        m = CITATION_RE.search(ln)
-        if m:
-            val = m.group(0).strip()
-            evidence.append(EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:200]))
-            return val, evidence
-
+# eLitigation judgments carry the neutral citation in a dedicated header div
+NEUTRAL_CIT_CSS = "div[class*='HN-NeutralCit']"
+# Header lines searched for a citation before falling back to the full text
+CITATION_LINES = 400
+
+def citation_from_dom(doc: ParsedDocument) -> Optional[tuple[str, EvidenceSpan]]:
+    """Well-formed pages: read it straight from the header element."""
+    dom_text = " ".join(select_lines(doc.root, NEUTRAL_CIT_CSS))
+    m = CITATION_RE.search(dom_text)
+    if not m:
+        return None
+    return m.group(0).strip(), EvidenceSpan(kind="dom", location="div.HN-NeutralCit", snippet=dom_text[:200])
+
+
+def citation_fallback(doc: ParsedDocument) -> Optional[tuple[str, EvidenceSpan]]:
+    """Last resorts once the header lines came up empty: full text, then the URL slug."""
     m = CITATION_RE.search(doc.text or "")
     if m:
         val = m.group(0).strip()
-        evidence.append(EvidenceSpan(kind="regex", location=f"full_text[{m.start()}:{m.end()}]", snippet=(doc.text or "")[max(0,m.start()-60):m.end()+60][:200]))
-        return val, evidence
+        return val, EvidenceSpan(kind="regex", location=f"full_text[{m.start()}:{m.end()}]", snippet=(doc.text or "")[max(0,m.start()-60):m.end()+60][:200])
 
     # Fallback: infer from URL
     um = URL_SLUG_RE.search(doc.url)
@@ -34,7 +37,26 @@ def extract_case_citation(doc: ParsedDocument) -> tuple[Optional[str], list[Evid
         slug = um.group("slug")  # e.g. 2026_SGHCA_3
         year, court, num = slug.split("_")
         val = f"[{year}] {court} {int(num)}"
-        evidence.append(EvidenceSpan(kind="regex", location="url_slug_fallback", snippet=slug))
-        return val, evidence
+        return val, EvidenceSpan(kind="regex", location="url_slug_fallback", snippet=slug)
 
-    return None, evidence
\ No newline at end of file
+    return None
+
+
+def extract_case_citation(doc: ParsedDocument) -> tuple[Optional[str], list[EvidenceSpan]]:
+    found = citation_from_dom(doc)
+
+    # Try text next
+    if found is None:
+        for i, ln in enumerate((doc.lines or [])[:CITATION_LINES]):
+            m = CITATION_RE.search(ln)
+            if m:
+                found = m.group(0).strip(), EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:200])
+                break
+
+    if found is None:
+        found = citation_fallback(doc)
+
+    if found is None:
+        return None, []
+    val, span = found
+    return val, [span]
@@ -5,42 +5,63 @@ from datetime import date, datetime
 from typing import Optional
 
 from legaldata.core.schemas import EvidenceSpan
-from legaldata.parsers.html_parser import ParsedDocument
+from legaldata.parsers.html_parser import ParsedDocument, select_lines
 
 # eLitigation often has a standalone line like: "29 September 2025"
+# Runs over "\n"-joined header lines, so whitespace must not cross a line break.
+# The month is matched as a plain word and resolved via MONTHS: one char-class loop
+# instead of a 12-way alternation the engine retries at every line start.
 DATE_LINE_RE = re.compile(
-    r"^(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})$",
-    re.IGNORECASE,
+    r"^(\d{1,2})[^\S\n]+([A-Za-z]{3,9})[^\S\n]+(\d{4})$",
+    re.MULTILINE,
 )
 
+# Header lines searched for a standalone date line
+DATE_LINES = 200
+
+# Header element holding the hearing/decision dates on eLitigation judgments
+DATE_HEARD_CSS = "div[class*='HN-DateHeard']"
+
 MONTHS = {
     "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
     "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
 }
 
 
-def extract_decision_date(doc: ParsedDocument) -> tuple[Optional[date], list[EvidenceSpan]]:
-    evidence: list[EvidenceSpan] = []
-    # Heuristic: scan header-ish lines and pick the LAST valid standalone date
-    found: Optional[date] = None
-    found_ev: Optional[EvidenceSpan] = None
-
-    for i, ln in enumerate(doc.lines[:200]):
-        m = DATE_LINE_RE.match(ln)
-        if not m:
+def last_valid_date(text: str) -> tuple[Optional[date], Optional[re.Match[str]]]:
+    for m in reversed(list(DATE_LINE_RE.finditer(text))):
+        month = MONTHS.get(m.group(2).lower())
+        if month is None:
             continue
         day = int(m.group(1))
-        month = MONTHS[m.group(2).lower()]
         year = int(m.group(3))
         try:
-            d = date(year, month, day)
-            found = d
-            found_ev = EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln)
+            return date(year, month, day), m
         except ValueError:
             continue
+    return None, None
+
 
-    if found and found_ev:
-        evidence.append(found_ev)
-        return found, evidence
+def decision_date_from_dom(doc: ParsedDocument) -> Optional[tuple[date, EvidenceSpan]]:
+    """Well-formed pages: read it straight from the header element."""
+    dom_text = "\n".join(select_lines(doc.root, DATE_HEARD_CSS))
+    found, m = last_valid_date(dom_text)
+    if not (found and m):
+        return None
+    return found, EvidenceSpan(kind="dom", location="div.HN-DateHeard", snippet=m.group(0))
+
+
+def extract_decision_date(doc: ParsedDocument) -> tuple[Optional[date], list[EvidenceSpan]]:
+    dom = decision_date_from_dom(doc)
+    if dom is not None:
+        found, span = dom
+        return found, [span]
+
+    # Heuristic: scan header-ish lines and pick the LAST valid standalone date
+    header = "\n".join(doc.lines[:DATE_LINES])
+    found, m = last_valid_date(header)
+    if found and m:
+        i = header.count("\n", 0, m.start())
+        return found, [EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=m.group(0))]
 
-    return None, evidence
+    return None, []
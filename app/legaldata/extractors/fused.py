@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any
+
+from legaldata.core.schemas import EvidenceSpan
+from legaldata.parsers.html_parser import ParsedDocument
+
+from legaldata.extractors.case_citation import CITATION_LINES, CITATION_RE, citation_fallback, citation_from_dom
+from legaldata.extractors.decision_date import DATE_LINE_RE, DATE_LINES, decision_date_from_dom, last_valid_date
+from legaldata.extractors.legal_references import CASE_CIT_RE, REF_LINES, STATUTE_RE, build_references
+from legaldata.extractors.parties import extract_parties
+from legaldata.extractors.presiding_judges import extract_presiding_judges
+
+# One union pattern for every line-regex extractor, dispatched on `m.lastgroup`.
+# A date match is a whole line of digits and a month name, so it can never
+# swallow a case citation or statute; citations and statutes never overlap either
+# (see REF_RE). The sweep therefore finds exactly what the separate scans would.
+_FUSED_RE = re.compile(
+    rf"(?P<date>{DATE_LINE_RE.pattern})|(?P<case>{CASE_CIT_RE.pattern})|(?P<statute>{STATUTE_RE.pattern})",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def extract_fused(doc: ParsedDocument) -> dict[str, tuple[Any, list[EvidenceSpan]]]:
+    """
+    Same result as `registry.extract_all`, but the header/body lines are swept once.
+
+    The DOM probes and the full-text/URL fallbacks still run per extractor; only
+    the line scans of case_citation, decision_date and legal_references are fused.
+    """
+    lines = doc.lines[:REF_LINES]
+    text = "\n".join(lines)
+    line_starts = list(accumulate((len(ln) + 1 for ln in lines[:-1]), initial=0))
+
+    date_hits: list[tuple[int, re.Match[str]]] = []
+    ref_hits: list[tuple[int, re.Match[str]]] = []
+    citation = None
+    for m in _FUSED_RE.finditer(text):
+        i = bisect_right(line_starts, m.start()) - 1
+        if m.lastgroup == "date":
+            if i < DATE_LINES:
+                date_hits.append((i, m))
+            continue
+
+        ref_hits.append((i, m))
+        # The SG neutral-citation form of a case match is what case_citation looks for
+        if citation is None and m.lastgroup == "case" and i < CITATION_LINES and CITATION_RE.fullmatch(m.group(0)):
+            citation = m.group(0).strip(), EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=lines[i][:200])
+
+    found_citation = citation_from_dom(doc) or citation or citation_fallback(doc)
+    case_citation = (found_citation[0], [found_citation[1]]) if found_citation else (None, [])
+
+    decision_date: tuple[Any, list[EvidenceSpan]] = (None, [])
+    dom_date = decision_date_from_dom(doc)
+    if dom_date is not None:
+        decision_date = (dom_date[0], [dom_date[1]])
+    else:
+        # LAST valid standalone date in the header wins
+        for i, m in reversed(date_hits):
+            found, _ = last_valid_date(m.group(0))
+            if found:
+                decision_date = (found, [EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=m.group(0))])
+                break
+
+    return {
+        "case_citation": case_citation,
+        "decision_date": decision_date,
+        "presiding_judges": extract_presiding_judges(doc),
+        "parties": extract_parties(doc),
+        "legal_references_cited": build_references(lines, ref_hits),
+    }
@@ -1,48 +1,76 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import accumulate
 
 from legaldata.core.schemas import EvidenceSpan, LegalReference
 from legaldata.parsers.html_parser import ParsedDocument
 
-# Best-effort, conservative patterns:
-CASE_CIT_RE = re.compile(r"\[(\d{4})\]\s+\d+\s+SLR\(R\)\s+\d+|\[(\d{4})\]\s+SG[A-Z]{2,}\s+\d+", re.IGNORECASE)
-STATUTE_RE = re.compile(r"\b[A-Z][A-Za-z ]+ Act\b(?:\s+\d{4})?(?:\s*\(\d{4}\s+Rev\s+Ed\))?", re.IGNORECASE)
+# Best-effort, conservative patterns.
+# Whitespace never crosses a line break, so they can run over "\n"-joined lines.
+_WS = r"[^\S\n]"
+CASE_CIT_RE = re.compile(
+    rf"\[(\d{{4}})\]{_WS}+\d+{_WS}+SLR\(R\){_WS}+\d+|\[(\d{{4}})\]{_WS}+SG[A-Z]{{2,}}{_WS}+\d+",
+    re.IGNORECASE,
+)
+STATUTE_RE = re.compile(
+    rf"\b[A-Z][A-Za-z ]+ Act\b(?:{_WS}+\d{{4}})?(?:{_WS}*\(\d{{4}}{_WS}+Rev{_WS}+Ed\))?",
+    re.IGNORECASE,
+)
 PINPOINT_RE = re.compile(r"\bat\s*\[(\d+)\]", re.IGNORECASE)
+# Lines scanned for references (long judgments are cut off here)
+REF_LINES = 2000
 
-def extract_legal_references(doc: ParsedDocument) -> tuple[list[LegalReference], list[EvidenceSpan]]:
+# Both kinds in a single left-to-right pass (a statute match can never contain "[",
+# so the two never overlap); `m.lastgroup` tells them apart.
+REF_RE = re.compile(rf"(?P<case>{CASE_CIT_RE.pattern})|(?P<statute>{STATUTE_RE.pattern})", re.IGNORECASE)
+
+def build_references(
+    lines: list[str], hits: Iterable[tuple[int, re.Match[str]]]
+) -> tuple[list[LegalReference], list[EvidenceSpan]]:
+    """
+    Turn `(line_index, match)` hits into de-duplicated references.
+
+    Each match must come from a pattern with `case`/`statute` named groups
+    (REF_RE, or the fused sweep in extractors/fused.py), in text order.
+    """
     refs: list[LegalReference] = []
     ev: list[EvidenceSpan] = []
 
+    # de-dup by (type,citation,pinpoint) before building any models
+    seen: set[tuple[str, str, str]] = set()
+    pin_line, pin = -1, None
+    for i, m in hits:
+        ln = lines[i]
+        ref_type = m.lastgroup
+        cit = m.group(0).strip()
+
+        pinpoint = None
+        if ref_type == "case":
+            if pin_line != i:
+                pm = PINPOINT_RE.search(ln)
+                pin_line, pin = i, (f"[{pm.group(1)}]" if pm else None)
+            pinpoint = pin
+
+        key = (ref_type, cit.casefold(), pinpoint or "")
+        if key in seen:
+            continue
+        seen.add(key)
+
+        span = EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:220])
+        refs.append(LegalReference(ref_type=ref_type, citation=cit, pinpoint=pinpoint, evidence=span))
+        ev.append(span)
+
+    return refs, ev
+
+
+def extract_legal_references(doc: ParsedDocument) -> tuple[list[LegalReference], list[EvidenceSpan]]:
     # Scan body lines (beyond header) but keep bounded for speed
-    for i, ln in enumerate(doc.lines[:2000]):
-        # cases
-        for m in CASE_CIT_RE.finditer(ln):
-            cit = m.group(0).strip()
-            pin = None
-            pm = PINPOINT_RE.search(ln)
-            if pm:
-                pin = f"[{pm.group(1)}]"
-            ref = LegalReference(ref_type="case", citation=cit, pinpoint=pin,
-                                 evidence=EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:220]))
-            refs.append(ref)
-            ev.append(ref.evidence)
-
-        # statutes
-        for m in STATUTE_RE.finditer(ln):
-            cit = m.group(0).strip()
-            ref = LegalReference(ref_type="statute", citation=cit, pinpoint=None,
-                                 evidence=EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:220]))
-            refs.append(ref)
-            ev.append(ref.evidence)
-
-    # de-dup by (type,citation,pinpoint)
-    seen = set()
-    deduped = []
-    for r in refs:
-        key = (r.ref_type, r.citation.lower(), r.pinpoint or "")
-        if key not in seen:
-            seen.add(key)
-            deduped.append(r)
-    return deduped, ev
+    lines = doc.lines[:REF_LINES]
+    text = "\n".join(lines)
+    line_starts = list(accumulate((len(ln) + 1 for ln in lines[:-1]), initial=0))
+
+    hits = ((bisect_right(line_starts, m.start()) - 1, m) for m in REF_RE.finditer(text))
+    return build_references(lines, hits)
@@ -9,7 +9,11 @@ V_LINE_RE = re.compile(r"^\s*v\s*$", re.IGNORECASE)
 
 def _clean_name(s: str) -> str:
     s = (s or "").replace("…", "").strip()
-    s = re.sub(r"\s+", " ", s)
+    # Common case is already single-spaced; isprintable() is False for every
+    # whitespace char except " ", so the collapse only runs when there is work to do.
+    # str.split() splits on the same whitespace class as the regex \s.
+    if "  " in s or not s.isprintable():
+        s = " ".join(s.split())
     return s
 
 
@@ -19,39 +23,38 @@ def extract_parties(doc: ParsedDocument) -> tuple[Parties, list[EvidenceSpan]]:
 
     lines = (doc.lines or [])[:450]
 
+    # Sentinel lookups below are C-level index scans over the shared lowercased lines
+    lines_lo = doc.lines_lower[:450]
+
     # ---------- Strategy 1: Between ... And ----------
     try:
-        idx_between = next(i for i, ln in enumerate(lines) if (ln or "").strip().lower() == "between")
-    except StopIteration:
+        idx_between = lines_lo.index("between")
+    except ValueError:
         idx_between = None
 
     if idx_between is not None:
-        i = idx_between + 1
+        try:
+            idx_and = lines_lo.index("and", idx_between + 1)
+        except ValueError:
+            idx_and = len(lines)
 
         # Claimants until "And"
-        while i < len(lines):
+        for i in range(idx_between + 1, idx_and):
             ln = lines[i] or ""
-            if ln.strip().lower() == "and":
-                break
             name = _clean_name(ln)
             if name and "claimant" not in name.lower():
                 parties.claimants.append(name)
                 ev.append(EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:200]))
-            i += 1
 
         # Defendants after "And"
-        if i < len(lines) and (lines[i] or "").strip().lower() == "and":
-            i += 1
-            while i < len(lines):
-                ln = lines[i] or ""
-                lo = ln.lower()
-                if "grounds of decision" in lo:
-                    break
-                name = _clean_name(ln)
-                if name and "defendant" not in name.lower():
-                    parties.defendants.append(name)
-                    ev.append(EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:200]))
-                i += 1
+        for i in range(idx_and + 1, len(lines)):
+            if "grounds of decision" in lines_lo[i]:
+                break
+            ln = lines[i] or ""
+            name = _clean_name(ln)
+            if name and "defendant" not in name.lower():
+                parties.defendants.append(name)
+                ev.append(EvidenceSpan(kind="line", location=f"lines[{i}]", snippet=ln[:200]))
 
         parties.claimants = [p for p in parties.claimants if p and "claimant" not in p.lower()]
         parties.defendants = [p for p in parties.defendants if p and "defendant" not in p.lower()]
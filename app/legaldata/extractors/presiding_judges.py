@@ -9,22 +9,24 @@ from legaldata.parsers.html_parser import ParsedDocument
 # Common SG judicial titles seen on eLitigation pages
 TITLES: Final = r"(?:CJ|JA|J|JC|SJ|AR|DJ|Magistrate)"
 
-# 1) Postfix: "Name Title" or "Name Title:"
-POSTFIX_RE: Final = re.compile(
-    rf"^(?P<name>[A-Z][A-Za-z'.\- ]{{2,}}?)\s+(?P<title>{TITLES})\b\s*:?\s*$"
+_NAME: Final = r"[A-Z][A-Za-z'.\- ]{2,}?"
+
+# One pattern for the three judge-line shapes, tried in order by the alternation
+# (one match() per line instead of three). All share the trailing "\b\s*:?\s*$".
+JUDGE_LINE_RE: Final = re.compile(
+    r"^(?:"
+    # 1) Postfix: "Name Title" or "Name Title:"
+    rf"(?P<post_name>{_NAME})\s+(?P<post_title>{TITLES})"
+    # 2) Prefix: "Title Name" or "Title Name:", e.g. "AR Tan Yu Qing"
+    rf"|(?P<pre_title>{TITLES})\s+(?P<pre_name>{_NAME})"
+    # 3) Some pages have "Before: Name Title" / "Coram: ..." (case-insensitive)
+    rf"|(?i:(?:Before|Coram)\s*:\s*(?P<b_name>{_NAME})\s+(?P<b_title>{TITLES}))"
+    r")\b\s*:?\s*$"
 )
 
-# 2) Prefix: "Title Name" or "Title Name:"
-# Example: "AR Tan Yu Qing"
-PREFIX_RE: Final = re.compile(
-    rf"^(?P<title>{TITLES})\s+(?P<name>[A-Z][A-Za-z'.\- ]{{2,}}?)\b\s*:?\s*$"
-)
-
-# 3) Some pages have "Before: Name Title" / "Coram: ..."
-BEFORE_RE: Final = re.compile(
-    rf"^(?:Before|Coram)\s*:\s*(?P<name>[A-Z][A-Za-z'.\- ]{{2,}}?)\s+(?P<title>{TITLES})\b\s*:?\s*$",
-    re.IGNORECASE,
-)
+# A judge line is a name plus a title; anything longer is body text. Skipping it up
+# front saves the lazy name group from walking every long paragraph in the window.
+MAX_JUDGE_LINE: Final = 160
 
 # Heuristic anchors: judge line tends to be near these header-ish lines
 ANCHORS: Final = (
@@ -59,12 +61,17 @@ def extract_presiding_judges(doc: ParsedDocument) -> tuple[list[str], list[Evide
 
     # Search in a focused window near the first anchor (reduces false positives).
     head = lines[:600]
-    anchor_idx = None
-    for i, ln in enumerate(head):
-        lo = (ln or "").strip().lower()
-        if any(a in lo for a in ANCHORS):
-            anchor_idx = i
-            break
+    # One str.find per anchor over the shared lowercased head text (the same 600
+    # lines) instead of per-anchor, per-line substring tests. Anchors never span a
+    # line break, so the earliest hit maps back to its line by counting newlines.
+    head_lo = doc.text_lower
+    first = len(head_lo)
+    for a in ANCHORS:
+        # Only an earlier hit matters, so each scan stops where the best one so far starts
+        p = head_lo.find(a, 0, first + len(a) - 1)
+        if p >= 0:
+            first = p
+    anchor_idx = head_lo.count("\n", 0, first) if first < len(head_lo) else None
 
     if anchor_idx is None:
         window = head
@@ -77,25 +84,18 @@ def extract_presiding_judges(doc: ParsedDocument) -> tuple[list[str], list[Evide
 
     def try_match(line: str, idx: int) -> bool:
         s = (line or "").strip()
-        if not s:
+        if not s or len(s) > MAX_JUDGE_LINE:
             return False
 
-        m = POSTFIX_RE.match(s)
-        if m:
-            _add(m.group("name"), m.group("title"), idx, s)
-            return True
-
-        m = PREFIX_RE.match(s)
-        if m:
-            _add(m.group("name"), m.group("title"), idx, s)
-            return True
-
-        m = BEFORE_RE.match(s)
-        if m:
-            _add(m.group("name"), m.group("title"), idx, s)
-            return True
+        m = JUDGE_LINE_RE.match(s)
+        if not m:
+            return False
 
-        return False
+        # Exactly one alternative matched; its groups are the only non-empty ones
+        name = m.group("post_name") or m.group("pre_name") or m.group("b_name")
+        title = m.group("post_title") or m.group("pre_title") or m.group("b_title")
+        _add(name, title, idx, s)
+        return True
 
     # Pass 1: direct line matches
     for off, ln in enumerate(window):
@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+import codecs
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from functools import cached_property
+from typing import Optional
+
+from selectolax.lexbor import LexborHTMLParser
+
+# Never visible text (comments are not text nodes)
+_NON_TEXT_TAGS = ["script", "style", "template"]
+# The judgment body on eLitigation pages, then a generic main region; nav/footer
+# chrome outside it never reaches the extractors. Falls back to the whole page.
+_CONTENT_SELECTORS = ("div.contentsOfFile", "main")
+# Encodings lexbor can take as raw bytes (it parses UTF-8 natively)
+_NATIVE_ENCODINGS = frozenset({"utf-8", "ascii"})
+# Header window the lowercased views cover: parties reads the first 450 lines,
+# presiding_judges the first 600. Nothing scans lowercased body text.
+HEADER_LINES = 600
 
 
 @dataclass(frozen=True)
@@ -9,10 +24,49 @@ class ParsedDocument:
     url: str
     text: str
     lines: list[str]
+    # DOM tree, for extractors that can read a value straight from a known header element
+    root: Optional[LexborHTMLParser] = None
+
+    @cached_property
+    def lines_lower(self) -> tuple[str, ...]:
+        """Stripped, lowercased first `HEADER_LINES` of `lines`, computed once and shared by every extractor."""
+        # cached_property writes to __dict__ directly, so this works on a frozen dataclass
+        return tuple(ln.strip().lower() for ln in self.lines[:HEADER_LINES])
+
+    @cached_property
+    def text_lower(self) -> str:
+        """`lines_lower` joined with "\n": the lowercased header as one buffer for substring scans."""
+        return "\n".join(self.lines_lower)
+
+
+def _text_lines(text: str) -> list[str]:
+    return [ln.strip() for ln in text.split("\n") if ln.strip()]
+
+
+def select_lines(root: Optional[LexborHTMLParser], selector: str) -> list[str]:
+    """Stripped, non-empty text lines under every element matching a CSS selector."""
+    if root is None:
+        return []
+    return [ln for node in root.css(selector) for ln in _text_lines(node.text(separator="\n"))]
+
+
+def parse_html(url: str, html: str | bytes, encoding: Optional[str] = None) -> ParsedDocument:
+    """
+    Parse a page into text lines plus a DOM tree.
+
+    `html` may be the raw response body; UTF-8 bytes go to lexbor as-is (no
+    decode/re-encode round-trip), other encodings are decoded first. Text comes
+    from the judgment container only; `root` still holds the full page.
+    """
+    if isinstance(html, bytes) and encoding and codecs.lookup(encoding).name not in _NATIVE_ENCODINGS:
+        html = html.decode(encoding, errors="replace")
 
+    # lexbor parses in C and hands back the text directly; no Python node tree
+    tree = LexborHTMLParser(html)
+    if tree.root is None:
+        return ParsedDocument(url=url, text="", lines=[], root=None)
 
-def parse_html(url: str, html: str) -> ParsedDocument:
-    soup = BeautifulSoup(html, "lxml")
-    text = soup.get_text("\n", strip=True)
-    lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
-    return ParsedDocument(url=url, text=text, lines=lines)
+    tree.strip_tags(_NON_TEXT_TAGS)
+    content = next((n for n in map(tree.css_first, _CONTENT_SELECTORS) if n is not None), tree.root)
+    lines = _text_lines(content.text(separator="\n"))
+    return ParsedDocument(url=url, text="\n".join(lines), lines=lines, root=tree)
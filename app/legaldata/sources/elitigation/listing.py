@@ -4,9 +4,14 @@ from dataclasses import dataclass
 from typing import List
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 
+# Judgment anchors in either URL form
+_JUDGMENT_LINK_CSS = "a[href*='/gd/s/'], a[href*='/gdviewer/s/']"
+# Both judgment URL forms in one pass over the raw HTML
+_LISTING_RE = re.compile(r"/gd(?:viewer)?/s/[A-Za-z0-9_\-]+")
+
 
 @dataclass
 class ListingPage:
@@ -49,21 +54,16 @@ def parse_listing_html(source_base_url: str, html: str, page_num: int) -> Listin
     """
     urls: set[str] = set()
 
-    soup = BeautifulSoup(html, "lxml")
-
-    # 1) Standard anchors
-    for a in soup.select("a[href]"):
-        href = a.get("href") or ""
-        if "/gd/s/" in href or "/gdviewer/s/" in href:
-            urls.add(urljoin(source_base_url, href))
-
-    # 2) Fallback: scan raw HTML (handles onclick, data-href, embedded text)
-    patterns = [
-        r"/gd/s/[A-Za-z0-9_\-]+",
-        r"/gdviewer/s/[A-Za-z0-9_\-]+",
-    ]
-    for pat in patterns:
-        for m in re.finditer(pat, html):
+    tree = LexborHTMLParser(html)
+
+    # 1) Standard anchors, filtered by lexbor's selector engine rather than in Python
+    for a in tree.css(_JUDGMENT_LINK_CSS):
+        urls.add(urljoin(source_base_url, a.attributes.get("href") or ""))
+
+    # 2) Fallback: scan raw HTML (handles onclick, data-href, embedded text), only
+    #    needed when the page has no plain judgment anchors
+    if not urls:
+        for m in _LISTING_RE.finditer(html):
             urls.add(urljoin(source_base_url, m.group(0)))
 
     return ListingPage(page_num=page_num, judgment_urls=sorted(urls))
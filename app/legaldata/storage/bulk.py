@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import orjson
+
+from sqlalchemy import case, delete, func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from legaldata.storage.db import Document, Extraction, utcnow
+
+_COPY_COLUMNS = (
+    "document_id",
+    "case_citation",
+    "decision_date",
+    "presiding_judges",
+    "parties",
+    "legal_references_cited",
+    "evidence",
+    "extractor_version",
+)
+_JSON_COLUMNS = frozenset({"presiding_judges", "parties", "legal_references_cited", "evidence"})
+
+
+def _dialect_insert(session: AsyncSession) -> Callable[..., Any]:
+    """Return the dialect-specific `insert` (the generic one has no ON CONFLICT)."""
+    name = session.get_bind().dialect.name
+    if name == "postgresql":
+        return postgresql.insert
+    if name == "sqlite":
+        return sqlite.insert
+    raise NotImplementedError(f"Bulk upsert not supported for dialect: {name}")
+
+
+async def upsert_documents(session: AsyncSession, rows: list[dict[str, Any]]) -> dict[str, int]:
+    """
+    Insert-or-update Document rows keyed by URL in one executemany ... RETURNING.
+
+    Every row must carry the same keys. A missing raw_path/content_hash (e.g.
+    fetch failed) keeps whatever an earlier run stored, and so does fetched_at.
+    Returns {url: document_id}.
+    """
+    if not rows:
+        return {}
+
+    insert = _dialect_insert(session)
+    stmt = insert(Document)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Document.url],
+        set_={
+            "raw_path": func.coalesce(stmt.excluded.raw_path, Document.raw_path),
+            "status": stmt.excluded.status,
+            # Only moves when this run actually fetched the page, like raw_path
+            "fetched_at": case((stmt.excluded.raw_path.is_not(None), utcnow()), else_=Document.fetched_at),
+            "error": stmt.excluded.error,
+            "content_hash": func.coalesce(stmt.excluded.content_hash, Document.content_hash),
+        },
+    )
+    # RETURNING hands back the ids of inserted and updated rows alike (no follow-up SELECT)
+    result = await session.execute(stmt.returning(Document.url, Document.id), rows)
+    return {url: doc_id for url, doc_id in result.all()}
+
+
+async def copy_extractions(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """
+    Replace the Extraction rows of a batch of documents in one bulk load.
+
+    On Postgres (asyncpg) rows are streamed with COPY; elsewhere they go out as
+    one executemany INSERT inside the caller's transaction. COPY can't upsert,
+    so existing rows for the same documents are deleted first.
+    """
+    if not rows:
+        return
+
+    await session.execute(
+        delete(Extraction).where(Extraction.document_id.in_([r["document_id"] for r in rows]))
+    )
+
+    if session.get_bind().dialect.driver != "asyncpg":
+        await session.execute(insert(Extraction), rows)
+        return
+
+    # COPY bypasses SQLAlchemy: apply the JSON encoding here (orjson, same as the
+    # engine's json_serializer). extracted_at is left to the column's server default.
+    records = []
+    for r in rows:
+        records.append(
+            tuple(orjson.dumps(r[c]).decode("utf-8") if c in _JSON_COLUMNS else r[c] for c in _COPY_COLUMNS)
+        )
+
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Extraction.__tablename__, records=records, columns=list(_COPY_COLUMNS)
+    )
@@ -4,9 +4,30 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
-    DateTime, Integer, String, Text, ForeignKey, JSON, UniqueConstraint
+    DateTime, Index, Integer, String, Text, ForeignKey, JSON, UniqueConstraint
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """The DB's current time in UTC, as a naive timestamp like `datetime.utcnow()`."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw) -> str:
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw) -> str:
+    # now() is in the session time zone; into a timestamp-without-time-zone column it
+    # would store server local time, unlike CrawlRun's datetime.utcnow()
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
 
 
 class Base(DeclarativeBase):
@@ -15,14 +36,19 @@ class Base(DeclarativeBase):
 
 class Document(Base):
     __tablename__ = "documents"
+    # Covers the crawler's "already extracted?" lookup without touching the table
+    __table_args__ = (Index("ix_documents_url_status", "url", "status"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     url: Mapped[str] = mapped_column(String(512), nullable=False, unique=True, index=True)
     source: Mapped[str] = mapped_column(String(64), default="elitigation")
     raw_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
-    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), default=datetime.utcnow)
+    # Stamped by the DB in UTC (bulk upserts and COPY never bind a Python datetime). The
+    # SQL default also covers tables created before the server default existed.
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), default=utcnow(), server_default=utcnow())
     status: Mapped[str] = mapped_column(String(32), default="RECEIVED")  # RECEIVED/FETCHED/EXTRACTED/FAILED
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)  # xxh3_64 hex of raw HTML
 
     extra: Mapped[dict] = mapped_column(JSON, default=dict)
 
@@ -35,7 +61,7 @@ class Extraction(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), index=True)
-    extracted_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), default=datetime.utcnow)
+    extracted_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), default=utcnow(), server_default=utcnow())
 
     case_citation: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     decision_date: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)  # ISO string to keep simple
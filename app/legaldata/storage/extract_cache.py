@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+import diskcache
+import orjson
+
+
+class ExtractCache:
+    """
+    On-disk memo of extraction results, keyed by (extractor version, URL, page hash).
+
+    Extraction is a pure function of those three, so a hit can skip parsing and
+    extraction entirely (e.g. re-crawling into a fresh DB while iterating on
+    anything but the extractors). Bumping `extractor_version` invalidates it.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._cache = diskcache.Cache(str(directory))
+
+    @staticmethod
+    def key(extractor_version: str, url: str, content_hash: str) -> str:
+        return f"{extractor_version}:{content_hash}:{url}"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        raw = self._cache.get(key)
+        return orjson.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        self._cache.set(key, orjson.dumps(value))
+
+    def close(self) -> None:
+        self._cache.close()
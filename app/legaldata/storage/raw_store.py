@@ -3,9 +3,11 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 
+import zstandard
+
 
 class RawStore:
-    """Stores raw HTML to disk. Keeps stable filenames for idempotency."""
+    """Stores raw HTML to disk (zstd-compressed). Keeps stable filenames for idempotency."""
 
     def __init__(self, root: Path) -> None:
         self.root = root
@@ -14,13 +16,23 @@ class RawStore:
         self.root.mkdir(parents=True, exist_ok=True)
 
     def slug_for_url(self, url: str) -> str:
-        h = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+        # Non-cryptographic use: blake2b with a 6-byte digest gives the same 12 hex chars
+        h = hashlib.blake2b(url.encode("utf-8"), digest_size=6).hexdigest()
         tail = url.rstrip("/").split("/")[-1]
         return f"{tail}_{h}"
 
-    def write_html(self, url: str, html: str) -> Path:
+    def write_html(self, url: str, html: bytes) -> Path:
+        """Store the page exactly as fetched (undecoded bytes)."""
         self.ensure()
         slug = self.slug_for_url(url)
-        path = self.root / f"{slug}.html"
-        path.write_text(html, encoding="utf-8")
+        path = self.root / f"{slug}.html.zst"
+        # Compressor objects are not thread-safe; callers may run this in worker threads
+        path.write_bytes(zstandard.ZstdCompressor(level=3).compress(html))
         return path
+
+    @staticmethod
+    def read_html(path: Path) -> bytes:
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data
@@ -1,17 +1,55 @@
 from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from legaldata.core.config import settings
-from legaldata.storage.db import Base
+from legaldata.storage.db import Base, Document, Extraction, utcnow
+
+
+def _json_dumps(value: Any) -> str:
+    # orjson returns bytes; drivers bind JSON columns as text
+    return orjson.dumps(value).decode("utf-8")
 
 
-engine = create_async_engine(settings.database_url, pool_pre_ping=True)
+engine = create_async_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    # Crawl results are written per listing page as executemany batches
+    insertmanyvalues_page_size=1000,
+    # JSON columns (evidence, references, parties) go through orjson instead of stdlib json
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+def _upgrade_schema(conn: Any) -> None:
+    # create_all skips tables that already exist, so databases created before
+    # content-hash skipping and the url/status index need these added in place
+    inspector = inspect(conn)
+    columns = {c["name"] for c in inspector.get_columns("documents")}
+    if "content_hash" not in columns:
+        conn.execute(text("ALTER TABLE documents ADD COLUMN content_hash VARCHAR(16)"))
+    for index in Document.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+    # COPY omits the timestamp columns, so Postgres needs their server default. SQLite
+    # can't add one in place; the models' SQL defaults cover its inserts instead.
+    if conn.dialect.name == "postgresql":
+        for column in (Document.__table__.c.fetched_at, Extraction.__table__.c.extracted_at):
+            current = {c["name"]: c for c in inspector.get_columns(column.table.name)}
+            if current[column.name]["default"] is None:
+                conn.execute(text(
+                    f"ALTER TABLE {column.table.name} ALTER COLUMN {column.name} "
+                    f"SET DEFAULT {utcnow().compile(dialect=conn.dialect)}"
+                ))
+
+
 async def init_db() -> None:
     # Ensure local directories exist (important for SQLite relative paths on Windows)
     settings.raw_store_dir.mkdir(parents=True, exist_ok=True)
@@ -20,5 +58,6 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_schema)
         await conn.execute(text("SELECT 1"))
 
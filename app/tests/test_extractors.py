@@ -1,7 +1,10 @@
+from datetime import date
+
 from legaldata.parsers.html_parser import parse_html
 from legaldata.extractors.case_citation import extract_case_citation
 from legaldata.extractors.decision_date import extract_decision_date
 from legaldata.extractors.presiding_judges import extract_presiding_judges
+from legaldata.extractors.legal_references import extract_legal_references
 
 def test_case_citation():
     html = "<html><body>[2025] SGHCR 33</body></html>"
@@ -10,6 +13,20 @@ def test_case_citation():
     assert val == "[2025] SGHCR 33"
     assert ev
 
+def test_case_citation_from_header_div():
+    html = (
+        "<html><body><p>Cited: [2019] SGCA 1</p>"
+        "<div class='HN-NeutralCit'>[2025] SGHCR 33</div>"
+        "<div class='HN-DateHeard'><p>1 August 2025</p><p>29 September 2025</p></div></body></html>"
+    )
+    doc = parse_html("x", html)
+    val, ev = extract_case_citation(doc)
+    assert val == "[2025] SGHCR 33"
+    assert ev[0].kind == "dom"
+    d, ev = extract_decision_date(doc)
+    assert d == date(2025, 9, 29)
+    assert ev[0].kind == "dom"
+
 def test_decision_date():
     html = "<html><body>29 September 2025</body></html>"
     doc = parse_html("x", html)
@@ -18,9 +35,74 @@ def test_decision_date():
     assert val.year == 2025
     assert ev
 
+def test_decision_date_picks_last_valid_line():
+    html = "<html><body><p>1 May 2024</p><p>29 September 2025</p><p>31 February 2025</p></body></html>"
+    doc = parse_html("x", html)
+    val, ev = extract_decision_date(doc)
+    assert val == date(2025, 9, 29)
+    assert ev[0].location == "lines[1]"
+
 def test_judges():
     html = "<html><body>AR Tan Yu Qing</body></html>"
     doc = parse_html("x", html)
     judges, ev = extract_presiding_judges(doc)
     # AR should match
     assert "Tan Yu Qing AR" in judges or "AR Tan Yu Qing" in judges or judges
+
+def test_legal_references():
+    html = (
+        "<html><body><p>See Foo v Bar [2020] SGHC 12 at [5] and the Evidence Act 1893.</p>"
+        "<p>[2020] SGHC 12 at [5] again</p><p>[2019] 2 SLR(R) 55</p></body></html>"
+    )
+    doc = parse_html("x", html)
+    refs, ev = extract_legal_references(doc)
+    cases = [(r.citation, r.pinpoint) for r in refs if r.ref_type == "case"]
+    statutes = [r.citation for r in refs if r.ref_type == "statute"]
+    assert cases == [("[2020] SGHC 12", "[5]"), ("[2019] 2 SLR(R) 55", None)]
+    assert statutes == ["and the Evidence Act 1893"]
+    assert ev[0].location == "lines[0]"
+
+def test_fused_matches_individual_extractors():
+    from legaldata.extractors.fused import extract_fused
+    from legaldata.extractors.registry import extract_all
+
+    html = (
+        "<html><body><p>In the General Division of the High Court</p>"
+        "<p>[2025] SGHCR 33</p><p>1 May 2024</p><p>29 September 2025</p>"
+        "<p>Before: Tan J</p><p>Between</p><p>ABC Pte Ltd</p><p>And</p><p>DEF</p>"
+        "<p>See [2019] SGCA 1 at [12] and the Evidence Act 1893 (2020 Rev Ed).</p>"
+        "<p>Followed [2010] 2 SLR(R) 5; [2019] SGCA 1 at [12].</p></body></html>"
+    )
+    doc = parse_html("https://example.test/gd/s/2025_SGHCR_33", html)
+    assert extract_fused(doc) == extract_all(doc)
+
+def test_fused_matches_individual_extractors_at_window_edges():
+    from legaldata.extractors.case_citation import CITATION_LINES
+    from legaldata.extractors.decision_date import DATE_LINES
+    from legaldata.extractors.fused import extract_fused
+    from legaldata.extractors.legal_references import REF_LINES
+    from legaldata.extractors.registry import extract_all
+    from legaldata.parsers.html_parser import ParsedDocument
+
+    lines = [f"para {i}" for i in range(REF_LINES + 10)]
+    lines[DATE_LINES - 1], lines[DATE_LINES] = "1 May 2024", "2 May 2024"
+    lines[CITATION_LINES - 1], lines[CITATION_LINES] = "See [2019] SGCA 1", "[2025] SGHCR 33"
+    lines[REF_LINES - 1], lines[REF_LINES] = "Cited: [2010] SGCA 5", "Cited: [2011] SGCA 6"
+    doc = ParsedDocument(url="x", text="\n".join(lines), lines=lines)
+    result = extract_fused(doc)
+    assert result == extract_all(doc)
+    assert result["decision_date"][0] == date(2024, 5, 1)
+    assert result["case_citation"][0] == "[2019] SGCA 1"
+
+def test_parse_html_from_bytes():
+    html = "<html><body><p>Café</p><p>[2025] SGHCR 33</p></body></html>"
+    assert parse_html("x", html.encode("utf-8"), encoding="utf-8").lines == ["Café", "[2025] SGHCR 33"]
+    assert parse_html("x", html.encode("cp1252"), encoding="cp1252").lines == ["Café", "[2025] SGHCR 33"]
+
+def test_parse_html_reads_judgment_container_only():
+    html = (
+        "<html><body><nav>Home</nav><div class='contentsOfFile'><p>[2025] SGHCR 33</p></div>"
+        "<footer>Contact</footer></body></html>"
+    )
+    doc = parse_html("x", html)
+    assert doc.lines == ["[2025] SGHCR 33"]
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from legaldata.core import http_client
+from legaldata.core.http_client import PoliteAsyncHttpClient, RetryableStatusError, _parse_retry_after
+
+URL = "https://www.elitigation.sg/gd/s/2025_SGHCR_33"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(http_client, "_backoff", lambda state: 0)
+
+
+def _fetch(*outcomes):
+    # GET URL (max_retries=3) through a mock transport replaying `outcomes`, the last one repeating.
+    # Returns the FetchResult or the raised exception, and the number of requests made.
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def main():
+        client = PoliteAsyncHttpClient(user_agent="test", timeout_s=5, max_concurrency=1, min_delay_s=0, max_retries=3)
+        await client.close()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await client.get_text(URL)
+        except Exception as e:
+            return e
+        finally:
+            await client.close()
+
+    return asyncio.run(main()), len(calls)
+
+
+def test_client_error_raises_without_retry():
+    result, calls = _fetch(httpx.Response(404), httpx.Response(200))
+    assert isinstance(result, httpx.HTTPStatusError)
+    assert calls == 1
+
+
+def test_429_waits_for_retry_after(monkeypatch):
+    def backoff(state):
+        raise AssertionError("Retry-After should be used instead of backoff")
+
+    monkeypatch.setattr(http_client, "_backoff", backoff)
+    result, calls = _fetch(httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, text="ok"))
+    assert result.text == "ok"
+    assert calls == 2
+
+
+def test_server_errors_exhaust_retries():
+    result, calls = _fetch(httpx.Response(503))
+    assert isinstance(result, RuntimeError)
+    assert isinstance(result.__cause__, RetryableStatusError)
+    assert result.__cause__.status_code == 503
+    assert calls == 3
+
+
+def test_transport_errors_are_retried():
+    result, calls = _fetch(httpx.ConnectError("refused"), httpx.Response(200, text="ok"))
+    assert result.text == "ok"
+    assert calls == 2
+
+    result, calls = _fetch(httpx.ConnectError("refused"))
+    assert isinstance(result, RuntimeError)
+    assert isinstance(result.__cause__, httpx.ConnectError)
+    assert calls == 3
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after("5") == 5.0
+    assert _parse_retry_after("-1") == 0.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("soon") is None
+
+    in_30s = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= _parse_retry_after(in_30s) <= 30
+    an_hour_ago = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+    assert _parse_retry_after(an_hour_ago) == 0.0
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from legaldata import cli
+from legaldata.cli import ProcessedCase, _extracted_hashes, _flush_results, _process_one
+from legaldata.storage.bulk import upsert_documents
+from legaldata.storage.db import Base, Document, Extraction
+from legaldata.storage.raw_store import RawStore
+
+URL = "https://www.elitigation.sg/gd/s/2025_SGHCR_33"
+
+
+def _page(citation: str) -> bytes:
+    return (
+        "<html><body><div class='contentsOfFile'>"
+        f"<div class='HN-NeutralCit'>{citation}</div>"
+        "<p>Tan Ah Kow J</p><p>29 September 2025</p>"
+        "</div></body></html>"
+    ).encode()
+
+
+class FakeClient:
+    def __init__(self, pages: dict[str, bytes]) -> None:
+        self.pages = pages
+
+    async def get_bytes(self, url: str) -> SimpleNamespace:
+        if url not in self.pages:
+            raise RuntimeError("fetch failed")
+        return SimpleNamespace(url=url, status_code=200, content=self.pages[url], encoding="utf-8")
+
+
+def _run(tmp_path, scenario) -> None:
+    async def main() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+                await scenario(session, RawStore(tmp_path / "raw"))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def _crawl(session, raw_store, pages, urls, refresh=False) -> list:
+    known = await _extracted_hashes(session, urls) if refresh else {}
+    client = FakeClient(pages)
+    results = [await _process_one(client, raw_store, u, known.get(u)) for u in urls]
+    await _flush_results(session, [r for r in results if r is not None])
+    return results
+
+
+async def _document(session, url=URL) -> Document:
+    session.expire_all()
+    return (await session.execute(select(Document).where(Document.url == url))).scalar_one()
+
+
+async def _extractions(session) -> list[Extraction]:
+    return list((await session.execute(select(Extraction))).scalars())
+
+
+def test_upsert_returns_id_per_url(tmp_path):
+    async def scenario(session, raw_store):
+        rows = [
+            {"url": f"{URL}_{i}", "source": "elitigation", "raw_path": None, "status": "FAILED", "error": None, "content_hash": None}
+            for i in range(3)
+        ]
+        ids = await upsert_documents(session, rows)
+        # Conflicting rows come back with their existing id
+        assert await upsert_documents(session, rows[1:]) == {r["url"]: ids[r["url"]] for r in rows[1:]}
+        await session.commit()
+        stored = dict((await session.execute(select(Document.url, Document.id))).all())
+        assert stored == ids
+
+    _run(tmp_path, scenario)
+
+
+def test_crawl_inserts_document_and_extraction(tmp_path):
+    async def scenario(session, raw_store):
+        await _crawl(session, raw_store, {URL: _page("[2025] SGHCR 33")}, [URL])
+        doc = await _document(session)
+        assert doc.status == "EXTRACTED"
+        assert doc.raw_path and doc.content_hash
+        (ext,) = await _extractions(session)
+        assert ext.document_id == doc.id
+        assert ext.case_citation == "[2025] SGHCR 33"
+
+    _run(tmp_path, scenario)
+
+
+def test_failed_fetch_keeps_previous_artifacts_until_rerun(tmp_path):
+    async def scenario(session, raw_store):
+        pages = {URL: _page("[2025] SGHCR 33")}
+        await _crawl(session, raw_store, pages, [URL])
+        # Backdated, so a re-stamp within the same second still shows
+        await session.execute(update(Document).values(fetched_at=datetime(2020, 1, 1)))
+        await session.commit()
+        first = await _document(session)
+        raw_path, content_hash, fetched_at = first.raw_path, first.content_hash, first.fetched_at
+
+        await _crawl(session, raw_store, {}, [URL])
+        doc = await _document(session)
+        assert doc.status == "FAILED"
+        assert "fetch failed" in doc.error
+        assert (doc.raw_path, doc.content_hash, doc.fetched_at) == (raw_path, content_hash, fetched_at)
+
+        await _crawl(session, raw_store, pages, [URL])
+        doc = await _document(session)
+        assert doc.status == "EXTRACTED"
+        assert doc.id == first.id
+        assert doc.fetched_at > fetched_at
+        assert len(await _extractions(session)) == 1
+
+    _run(tmp_path, scenario)
+
+
+def test_refresh_skips_unchanged_and_replaces_changed(tmp_path):
+    async def scenario(session, raw_store):
+        await _crawl(session, raw_store, {URL: _page("[2025] SGHCR 33")}, [URL])
+        content_hash = (await _document(session)).content_hash
+
+        assert await _crawl(session, raw_store, {URL: _page("[2025] SGHCR 33")}, [URL], refresh=True) == [None]
+        assert (await _document(session)).content_hash == content_hash
+
+        await _crawl(session, raw_store, {URL: _page("[2025] SGHCR 34")}, [URL], refresh=True)
+        assert (await _document(session)).content_hash != content_hash
+        (ext,) = await _extractions(session)
+        assert ext.case_citation == "[2025] SGHCR 34"
+
+    _run(tmp_path, scenario)
+
+
+def test_integrity_error_falls_back_to_per_row_writes(tmp_path):
+    async def scenario(session, raw_store):
+        good = await _process_one(FakeClient({URL: _page("[2025] SGHCR 33")}), raw_store, URL)
+        # url is NOT NULL, so this row fails the batch and then only itself
+        bad = ProcessedCase(document={**good.document, "url": None}, extraction=good.extraction)
+        await _flush_results(session, [bad, good])
+        assert (await _document(session)).status == "EXTRACTED"
+        assert len(await _extractions(session)) == 1
+
+    _run(tmp_path, scenario)
+
+
+def test_other_db_errors_roll_back_the_whole_page(tmp_path, monkeypatch):
+    async def scenario(session, raw_store):
+        await _crawl(session, raw_store, {URL: _page("[2025] SGHCR 33")}, [URL])
+        content_hash = (await _document(session)).content_hash
+
+        async def locked(session, rows):
+            raise OperationalError("INSERT INTO extractions", {}, Exception("database is locked"))
+
+        # Fails after upsert_documents has already re-marked the document
+        monkeypatch.setattr(cli, "copy_extractions", locked)
+        with pytest.raises(OperationalError):
+            await _crawl(session, raw_store, {URL: _page("[2025] SGHCR 34")}, [URL], refresh=True)
+        # As the crawl's FAILED handler does
+        await session.commit()
+
+        assert (await _document(session)).content_hash == content_hash
+        (ext,) = await _extractions(session)
+        assert ext.case_citation == "[2025] SGHCR 33"
+
+    _run(tmp_path, scenario)